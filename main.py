@@ -3,69 +3,313 @@
 import sys
 import pickle
 import os
+import msgpack
+from io import BytesIO
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QFormLayout, QLineEdit,
     QPushButton, QComboBox, QListWidget, QFileDialog, QMessageBox,
     QLabel, QHBoxLayout, QScrollArea, QFrame, QCheckBox, QTabWidget,
-    QDialog, QTextEdit, QTableWidget, QTableWidgetItem
+    QDialog, QTextEdit, QTableWidget, QTableWidgetItem, QShortcut
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QFontDatabase, QCursor
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.units import mm
-from reportlab.lib.colors import HexColor
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from PyQt5.QtCore import Qt, QTimer, QByteArray, QRegularExpression
+from PyQt5.QtGui import QFont, QFontDatabase, QCursor, QKeySequence, QRegularExpressionValidator
 from bidi.algorithm import get_display
 import arabic_reshaper
 import re
 import datetime
 import webbrowser
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.font_manager as fm
+from functools import lru_cache
 
 # Check if Vazir font file exists and register it
 FONT_PATH = 'Vazir.ttf'
 FONT_NAME = 'Vazir'
 FALLBACK_FONT = 'Helvetica'
 
+# Borderless scroll areas with hidden scrollbars, shared by all tabs
+_SCROLL_CSS = "QScrollArea { border: none; } QScrollBar:vertical { width: 0px; } QScrollBar:horizontal { height: 0px; }"
+
+# Input validation patterns
+_PHONE_RE = re.compile(r'^09\d{9}\Z')
+_EMAIL_RE = re.compile(r'^[\w\.-]+@[\w\.-]+\.\w+\Z')
+# Thousands separators, spaces and RTL/LTR marks dropped before parsing a price
+_DROP_CHARS = str.maketrans('', '', ', \u200f\u200e')
+
+# Raw Vazir.ttf contents, read once and shared by ReportLab and Qt
+_FONT_BYTES = None
+
 def register_fonts():
-    """Register Vazir font for PDF and UI, with fallback to Helvetica"""
-    global FONT_NAME
+    """Load Vazir font for PDF and UI, with fallback to Helvetica"""
+    global FONT_NAME, _FONT_BYTES
     try:
-        if os.path.exists(FONT_PATH):
-            pdfmetrics.registerFont(TTFont('Vazir', FONT_PATH))
-            # Register font for matplotlib
-            fm.fontManager.addfont(FONT_PATH)
-            plt.rcParams['font.family'] = 'Vazir'
-        else:
-            raise FileNotFoundError("Vazir.ttf not found")
+        with open(FONT_PATH, 'rb') as f:
+            _FONT_BYTES = f.read()
     except Exception as e:
         print(f"Font registration failed: {e}. Falling back to {FALLBACK_FONT}")
         FONT_NAME = FALLBACK_FONT
-        plt.rcParams['font.family'] = 'sans-serif'
-        plt.rcParams['font.sans-serif'] = [FALLBACK_FONT]
 
 # Register fonts at startup
 register_fonts()
 
-# Load Vazir font for Qt UI
+@lru_cache(maxsize=None)
+def register_pdf_font():
+    """Register the UI font with ReportLab on first export and return the PDF font name"""
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    if FONT_NAME == FALLBACK_FONT:
+        return FALLBACK_FONT
+    try:
+        pdfmetrics.registerFont(TTFont(FONT_NAME, BytesIO(_FONT_BYTES)))
+    except Exception as e:
+        print(f"PDF font registration failed: {e}. Falling back to {FALLBACK_FONT}")
+        return FALLBACK_FONT
+    return FONT_NAME
+
+def register_matplotlib_font():
+    """Register the UI font for matplotlib (imported only when charts are built)"""
+    import matplotlib.font_manager as fm
+    import matplotlib.pyplot as plt
+    if FONT_NAME == FALLBACK_FONT:
+        plt.rcParams['font.family'] = 'sans-serif'
+        plt.rcParams['font.sans-serif'] = [FALLBACK_FONT]
+    else:
+        fm.fontManager.addfont(FONT_PATH)
+        plt.rcParams['font.family'] = FONT_NAME
+
+# Load Vazir font for Qt UI (built once, on first use after QApplication exists)
+_QT_FONT = None
+
 def load_qt_font():
-   
-    font_db = QFontDatabase()
-    if os.path.exists(FONT_PATH):
-        font_id = font_db.addApplicationFont(FONT_PATH)
-        if font_id != -1:
-            font_families = font_db.applicationFontFamilies(font_id)
-            if font_families:
-                return QFont(font_families[0], 10)
-    return QFont(FALLBACK_FONT, 10)
+    """Return the shared Qt UI font, registering Vazir on the first call"""
+    global _QT_FONT
+    if _QT_FONT is None:
+        _QT_FONT = QFont(FALLBACK_FONT, 10)
+        if _FONT_BYTES is not None:
+            font_id = QFontDatabase.addApplicationFontFromData(QByteArray(_FONT_BYTES))
+            if font_id != -1:
+                font_families = QFontDatabase.applicationFontFamilies(font_id)
+                if font_families:
+                    _QT_FONT = QFont(font_families[0], 10)
+    return _QT_FONT
+
+@lru_cache(maxsize=2048)
+def _reshape_cached(text):
+    """Reshape and reorder a Persian string (memoized)"""
+    return get_display(arabic_reshaper.reshape(text))
 
 def reshape(text):
     """Reshape Persian text for correct display"""
-    return get_display(arabic_reshaper.reshape(str(text)))
+    text = str(text)
+    # Pure ASCII has nothing to shape or reorder
+    return text if text.isascii() else _reshape_cached(text)
+
+# Static chart labels and titles, reshaped once
+_LBL_REG = (reshape('سفارشات ثبت شده'), reshape('بدون سفارش'))
+_TITLE_REG = reshape("وضعیت سفارشات ثبت شده")
+_LBL_UNREG = (reshape('سفارشات ثبت نشده'), reshape('بدون سفارش'))
+_TITLE_UNREG = reshape("وضعیت سفارشات ثبت نشده")
+
+# Static PDF texts, reshaped once
+_PDF_TITLE = reshape("پیش‌فاکتور حرفه‌ای")
+_PDF_SELLER_INFO = reshape("اطلاعات فروشنده")
+_PDF_BUYER_INFO = reshape("اطلاعات خریدار")
+_PDF_HEADERS = tuple(reshape(header) for header in
+                     ["ردیف", "نام کالا", "قیمت واحد", "تعداد", "واحد", "قیمت کل"])
+_PDF_FOOTER = reshape("نرم‌افزارهای کاربردی ویندوز | توسعه توسط Amir-Mahdi-Barati")
+
+# Theme stylesheet: one shared template, colored per theme
+_BASE_QSS = """
+QWidget {{
+    background-color: {bg};
+    color: {fg};
+    font-family: {font};
+    font-size: 11pt;
+}}
+QTabWidget::pane {{
+    border: 1px solid {border};
+    background: {surface};
+}}
+QTabBar::tab {{
+    background: {tab_bg};
+    color: {fg};
+    padding: 8px 16px;
+    margin: 4px;
+    border-radius: 4px;
+}}
+QTabBar::tab:selected {{
+    background: #1976D2;
+    color: white;
+}}
+QLabel {{
+    background: transparent;
+    color: {fg};
+    padding: 8px;
+    margin: 2px;
+}}
+QLineEdit, QComboBox, QTextEdit {{
+    background-color: {surface};
+    border: 1px solid {border};
+    border-radius: 4px;
+    padding: 8px;
+    color: {fg};
+    text-align: right;
+    margin-bottom: 8px;
+}}
+QComboBox {{
+    padding-right: 12px;
+}}
+QComboBox::drop-down {{
+    border: none;
+    width: 16px;
+}}
+QPushButton {{
+    background-color: #1976D2;
+    color: white;
+    border: 1px solid #1565C0;
+    border-radius: 4px;
+    padding: 8px;
+    font-weight: bold;
+    font-size: 11pt;
+    margin-top: 8px;
+}}
+QPushButton:hover {{
+    background-color: #1565C0;
+}}
+QPushButton:pressed {{
+    background-color: #0D47A1;
+}}
+QPushButton[class="muted"] {{
+    background-color: {muted};
+    border: 1px solid {muted_border};
+    border-radius: 4px;
+}}
+QPushButton[class="muted"]:hover {{
+    background-color: {muted_hover};
+}}
+QPushButton[class="muted"]:pressed {{
+    background-color: {muted_pressed};
+}}
+QPushButton[class="danger"] {{
+    background-color: #D32F2F;
+    border: 1px solid #B71C1C;
+    border-radius: 4px;
+}}
+QPushButton[class="danger"]:hover {{
+    background-color: #B71C1C;
+}}
+QPushButton[class="danger"]:pressed {{
+    background-color: #7F0000;
+}}
+QPushButton[class="success"] {{
+    background-color: #388E3C;
+    border: 1px solid #2E7D32;
+    border-radius: 4px;
+}}
+QPushButton[class="success"]:hover {{
+    background-color: #2E7D32;
+}}
+QPushButton[class="success"]:pressed {{
+    background-color: #1B5E20;
+}}
+QFrame#infoFrame {{
+    background-color: {surface};
+    border: 1px solid {border};
+    border-radius: 6px;
+    padding: 12px;
+}}
+QListWidget#itemList {{
+    background-color: {surface};
+    border: 1px solid {border};
+    border-radius: 4px;
+    padding: 8px;
+    color: {fg};
+}}
+QTableWidget#statsTable {{
+    background-color: {surface};
+    border: 1px solid {border};
+    border-radius: 4px;
+    color: {fg};
+    gridline-color: {border};
+    font-family: {font};
+    font-size: 10pt;
+}}
+QTableWidget#statsTable::item {{
+    padding: 10px;
+    text-align: center;
+}}
+QHeaderView::section {{
+    font-family: {font};
+    font-size: 10pt;
+    padding: 8px;
+    background-color: #1976D2;
+    color: white;
+    border: none;
+}}
+QCheckBox {{
+    color: {fg};
+    padding: 8px;
+    font-size: 10pt;
+    font-weight: bold;
+}}
+QLabel#headerLabel {{
+    background: transparent;
+    color: {accent};
+    border-bottom: 2px solid #1976D2;
+    padding: 8px;
+    margin: 2px;
+    font-size: 13pt;
+}}
+QLabel#githubLabel {{
+    color: {accent};
+    padding: 8px;
+    font-size: 10pt;
+    font-weight: bold;
+}}
+QLabel#githubLabel:hover {{
+    color: {accent_hover};
+}}
+"""
+
+_DARK_TOKENS = {
+    'bg': '#212121',
+    'fg': '#E0E0E0',
+    'surface': '#2D2D2D',
+    'border': '#555555',
+    'tab_bg': '#2D2D2D',
+    'muted': '#424242',
+    'muted_border': '#616161',
+    'muted_hover': '#616161',
+    'muted_pressed': '#212121',
+    'accent': '#64B5F6',
+    'accent_hover': '#BBDEFB'
+}
+
+_LIGHT_TOKENS = {
+    'bg': '#F5F6FA',
+    'fg': '#1A2526',
+    'surface': '#FFFFFF',
+    'border': '#B0BEC5',
+    'tab_bg': '#E0E0E0',
+    'muted': '#E0E0E0',
+    'muted_border': '#B0BEC5',
+    'muted_hover': '#B0BEC5',
+    'muted_pressed': '#90A4AE',
+    'accent': '#1976D2',
+    'accent_hover': '#1565C0'
+}
+
+# Keyed by InvoiceApp.is_dark_theme
+_STYLESHEETS = {
+    True: _BASE_QSS.format(font=FONT_NAME, **_DARK_TOKENS),
+    False: _BASE_QSS.format(font=FONT_NAME, **_LIGHT_TOKENS)
+}
+
+def _fmt_item_row(item):
+    """Format one invoice item for display"""
+    return f"{item[0]} | {item[1]:,.0f} × {item[2]} {item[3]} = {item[4]:,.0f} تومان"
+
+def _format_order(order, index):
+    """Build the list label for an order"""
+    return f"سفارش #{index+1} | مشتری: {order['buyer_name']} | تاریخ: {order['date']} | جمع: {order['total']:,.0f} تومان"
 
 class EditOrderDialog(QDialog):
     """Dialog for editing orders"""
@@ -102,8 +346,7 @@ class EditOrderDialog(QDialog):
         # Items display
         self.items_text = QTextEdit()
         self.items_text.setReadOnly(True)
-        items_str = "\n".join([(f"{item[0]} | {item[1]:,.0f} × {item[2]} {item[3]} = {item[4]:,.0f} تومان")
-                              for item in self.order['items']])
+        items_str = "\n".join(map(_fmt_item_row, self.order['items']))
         self.items_text.setText(items_str)
         self.items_text.setFixedHeight(200)
         layout.addWidget(self.items_text)
@@ -139,14 +382,34 @@ class EditOrderDialog(QDialog):
         }
 
 class InvoiceApp(QWidget):
+    _YES_NO = QMessageBox.Yes | QMessageBox.No
+
     def __init__(self):
         super().__init__()
         self.items = []
+        # Sum of the current invoice's item totals, kept in step with self.items
+        self._running_total = 0
+        # (row, item) of the last item removed by delete_item, for undo
+        self._last_deleted_item = None
+        # Formatted current date, refreshed when the day changes
+        self._today_ord = None
+        self._today_str = ""
         self.registered_orders = []
         self.unregistered_orders = []
-        self.data_file = "orders.pkl"
+        self.data_file = "orders.msgpack"
+        self.legacy_data_file = "orders.pkl"
         self.is_dark_theme = False
+        # Coalesce bursts of edits into a single write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self.save_data)
         self.load_data()
+        # Running sales total of registered orders; statistics are only
+        # recomputed after a change marks them dirty
+        self._total_amount = sum(order['total'] for order in self.registered_orders)
+        self._stats_dirty = True
+        self._stats_built = False
         self.init_ui()
         self.setWindowTitle("پیش فاکتور")
         self.setWindowFlags(Qt.Window | Qt.FramelessWindowHint)
@@ -157,27 +420,46 @@ class InvoiceApp(QWidget):
         try:
             if os.path.exists(self.data_file):
                 with open(self.data_file, 'rb') as f:
+                    data = msgpack.unpackb(f.read(), raw=False)
+                # msgpack stores tuples as lists; restore the item tuples
+                for order in data.get('registered', []) + data.get('unregistered', []):
+                    order['items'] = [tuple(item) for item in order['items']]
+            elif os.path.exists(self.legacy_data_file):
+                # Orders saved by older versions are migrated on the next save
+                with open(self.legacy_data_file, 'rb') as f:
                     data = pickle.load(f)
-                    self.registered_orders = data.get('registered', [])
-                    self.unregistered_orders = data.get('unregistered', [])
             else:
-                self.registered_orders = []
-                self.unregistered_orders = []
-        except (pickle.UnpicklingError, EOFError, AttributeError):
+                data = {}
+            self.registered_orders = data.get('registered', [])
+            self.unregistered_orders = data.get('unregistered', [])
+        except (msgpack.UnpackException, ValueError, pickle.UnpicklingError, EOFError, AttributeError):
             self.registered_orders = []
             self.unregistered_orders = []
 
     def save_data(self):
         """Save orders to file silently"""
+        self._save_timer.stop()
+        tmp_file = self.data_file + '.tmp'
         try:
-            with open(self.data_file, 'wb') as f:
-                pickle.dump({
+            with open(tmp_file, 'wb') as f:
+                f.write(msgpack.packb({
                     'registered': self.registered_orders,
                     'unregistered': self.unregistered_orders
-                }, f)
+                }, use_bin_type=True))
+            os.replace(tmp_file, self.data_file)
         except Exception:
             pass
 
+    def _schedule_save(self):
+        """Save orders after a short delay, coalescing bursts of changes"""
+        self._save_timer.start()
+
+    def closeEvent(self, event):
+        """Flush a pending save before closing"""
+        if self._save_timer.isActive():
+            self.save_data()
+        super().closeEvent(event)
+
     def init_ui(self):
         """Initialize main UI"""
         main_layout = QVBoxLayout(self)
@@ -189,20 +471,22 @@ class InvoiceApp(QWidget):
         toolbar_layout.setSpacing(10)
         minimize_btn = QPushButton("◀▶")
         minimize_btn.setFixedSize(45,45)
-        minimize_btn.setObjectName("minimizeBtn")
+        minimize_btn.setProperty("class", "muted")
         minimize_btn.clicked.connect(self.showMinimized)
         close_btn = QPushButton("×")
         close_btn.setFixedSize(45, 45)
-        close_btn.setObjectName("closeBtn")
+        close_btn.setProperty("class", "danger")
         close_btn.clicked.connect(self.close)
         toolbar_layout.addStretch()
         toolbar_layout.addWidget(minimize_btn)
         toolbar_layout.addWidget(close_btn)
         main_layout.addLayout(toolbar_layout)
 
+        ui_font = load_qt_font()
+
         # Tab widget
         self.tabs = QTabWidget()
-        self.tabs.setFont(load_qt_font())
+        self.tabs.setFont(ui_font)
         self.tabs.setFixedHeight(600)
         main_layout.addWidget(self.tabs)
 
@@ -221,20 +505,21 @@ class InvoiceApp(QWidget):
         # Statistics Tab
         self.stats_tab = QWidget()
         self.stats_layout = QVBoxLayout(self.stats_tab)
-        self.setup_statistics_ui()
         self.tabs.addTab(self.stats_tab, "📊 آمار و اطلاعات")
+        # Charts are built on first visit to keep matplotlib out of startup
+        self.tabs.currentChanged.connect(self._maybe_build_stats)
 
         # Footer
         footer_layout = QHBoxLayout()
         footer_layout.setSpacing(10)
         self.theme_toggle = QCheckBox("حالت تیره/روشن")
         self.theme_toggle.setChecked(False)
-        self.theme_toggle.setFont(load_qt_font())
+        self.theme_toggle.setFont(ui_font)
         self.theme_toggle.stateChanged.connect(self.toggle_theme)
         footer_layout.addWidget(self.theme_toggle)
 
         github_label = QLabel("GitHub")
-        github_label.setFont(load_qt_font())
+        github_label.setFont(ui_font)
         github_label.setObjectName("githubLabel")
         github_label.setCursor(QCursor(Qt.PointingHandCursor))
         github_label.mousePressEvent = lambda event: webbrowser.open("https://github.com/Amir-Mahdi-Barati")
@@ -244,11 +529,16 @@ class InvoiceApp(QWidget):
 
         self.apply_theme()
 
-    def setup_home_ui(self):
-        """Setup UI for Home tab"""
+    def _make_scroll_area(self):
+        """Create a tab's scroll area"""
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; } QScrollBar:vertical { width: 0px; } QScrollBar:horizontal { height: 0px; }")
+        scroll.setStyleSheet(_SCROLL_CSS)
+        return scroll
+
+    def setup_home_ui(self):
+        """Setup UI for Home tab"""
+        scroll = self._make_scroll_area()
         content_widget = QWidget()
         scroll.setWidget(content_widget)
         content_layout = QVBoxLayout(content_widget)
@@ -323,6 +613,11 @@ class InvoiceApp(QWidget):
         self.item_name = QLineEdit()
         self.item_price = QLineEdit()
         self.item_price.setPlaceholderText("مثال: 100000")
+        # Whole amounts in Latin, Persian or Arabic-Indic digits; separators and
+        # RTL/LTR marks are dropped by _DROP_CHARS before float() parses the text
+        price_validator = QRegularExpressionValidator(
+            QRegularExpression('[0-9\u06F0-\u06F9\u0660-\u0669, \u200e\u200f]*'), self.item_price)
+        self.item_price.setValidator(price_validator)
         self.item_quantity = QLineEdit()
         self.item_quantity.setPlaceholderText("مثال: 5")
         self.item_unit = QComboBox()
@@ -343,8 +638,13 @@ class InvoiceApp(QWidget):
         self.btn_clear = QPushButton("🗑️ پاک کردن لیست")
         self.btn_clear.clicked.connect(self.clear_items)
         self.btn_delete = QPushButton("❌ حذف کالا")
-        self.btn_delete.setObjectName("deleteBtn")
+        self.btn_delete.setProperty("class", "danger")
+        self.btn_delete.setToolTip("Ctrl+Z: بازگردانی آخرین کالای حذف شده")
         self.btn_delete.clicked.connect(self.delete_item)
+        # Only active on the Home tab, where the invoice item list lives
+        self.undo_shortcut = QShortcut(QKeySequence.Undo, self.home_tab)
+        self.undo_shortcut.setContext(Qt.WidgetWithChildrenShortcut)
+        self.undo_shortcut.activated.connect(self.undo_delete_item)
         self.btn_add_to_registered = QPushButton("✅ ثبت سفارش")
         self.btn_add_to_registered.clicked.connect(self.add_to_registered_orders)
         self.btn_add_to_unregistered = QPushButton("📥ثبت موقت")
@@ -380,9 +680,7 @@ class InvoiceApp(QWidget):
 
     def setup_orders_ui(self):
         """Setup UI for Orders tab"""
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; } QScrollBar:vertical { width: 0px; } QScrollBar:horizontal { height: 0px; }")
+        scroll = self._make_scroll_area()
         content_widget = QWidget()
         scroll.setWidget(content_widget)
         content_layout = QVBoxLayout(content_widget)
@@ -406,7 +704,7 @@ class InvoiceApp(QWidget):
 
         reg_button_layout = QHBoxLayout()
         self.btn_delete_order = QPushButton("❌حذف سفارشات")
-        self.btn_delete_order.setObjectName("deleteBtn")
+        self.btn_delete_order.setProperty("class", "danger")
         self.btn_delete_order.setFixedWidth(200)
         self.btn_delete_order.clicked.connect(self.delete_registered_order)
         reg_button_layout.addWidget(self.btn_delete_order)
@@ -429,11 +727,11 @@ class InvoiceApp(QWidget):
 
         unreg_button_layout = QHBoxLayout()
         self.btn_delete_unreg_order = QPushButton("❌حذف سفارشات")
-        self.btn_delete_unreg_order.setObjectName("deleteBtn")
+        self.btn_delete_unreg_order.setProperty("class", "danger")
         self.btn_delete_unreg_order.setFixedWidth(200)
         self.btn_delete_unreg_order.clicked.connect(self.delete_unregistered_order)
         self.btn_move_to_registered = QPushButton("انتقال به ثبت شده")
-        self.btn_move_to_registered.setObjectName("moveBtn")
+        self.btn_move_to_registered.setProperty("class", "success")
         self.btn_move_to_registered.setFixedWidth(200)
         self.btn_move_to_registered.clicked.connect(self.move_to_registered)
         unreg_button_layout.addWidget(self.btn_delete_unreg_order)
@@ -444,11 +742,18 @@ class InvoiceApp(QWidget):
         self.update_registered_orders_list()
         self.update_unregistered_orders_list()
 
+    def _maybe_build_stats(self, index):
+        """Build the Statistics tab the first time it is shown"""
+        if index == self.tabs.indexOf(self.stats_tab) and not self._stats_built:
+            self.setup_statistics_ui()
+
     def setup_statistics_ui(self):
         """Setup UI for Statistics tab"""
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; } QScrollBar:vertical { width: 0px; } QScrollBar:horizontal { height: 0px; }")
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        register_matplotlib_font()
+
+        scroll = self._make_scroll_area()
         content_widget = QWidget()
         scroll.setWidget(content_widget)
         content_layout = QVBoxLayout(content_widget)
@@ -492,6 +797,23 @@ class InvoiceApp(QWidget):
                 border: none;
             }}
         """)
+        self.stats_table.setSortingEnabled(False)
+        # Build the cells once; refreshes only change the value texts
+        font = load_qt_font()
+        flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+        descriptions = [
+            "تعداد سفارشات ثبت شده",
+            "تعداد سفارشات ثبت نشده",
+            "جمع کل فروش (سفارشات ثبت شده)",
+            "میانگین هر سفارش (ثبت شده)"
+        ]
+        for row, desc in enumerate(descriptions):
+            for col, text in enumerate(("", desc)):
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignCenter)
+                item.setFlags(flags)
+                item.setFont(font)
+                self.stats_table.setItem(row, col, item)
         content_layout.addWidget(self.stats_table)
 
         # Pie charts container
@@ -502,87 +824,87 @@ class InvoiceApp(QWidget):
         self.figure_reg = plt.Figure(figsize=(5, 2.5))
         self.canvas_reg = FigureCanvas(self.figure_reg)
         self.canvas_reg.setFixedSize(580, 250)
+        self.ax_reg = self.figure_reg.add_subplot(111)
         charts_layout.addWidget(self.canvas_reg)
 
         # Unregistered orders pie chart
         self.figure_unreg = plt.Figure(figsize=(5, 2.5))
         self.canvas_unreg = FigureCanvas(self.figure_unreg)
         self.canvas_unreg.setFixedSize(580, 250)
+        self.ax_unreg = self.figure_unreg.add_subplot(111)
+        # Last sizes drawn on each canvas, to skip redundant redraws
+        self._pie_sizes = {}
         charts_layout.addWidget(self.canvas_unreg)
 
         content_layout.addLayout(charts_layout)
 
         self.btn_clear_data = QPushButton("🗑️حذف تمامی داده‌ها")
-        self.btn_clear_data.setObjectName("deleteBtn")
+        self.btn_clear_data.setProperty("class", "danger")
         self.btn_clear_data.setFixedWidth(200)
         self.btn_clear_data.clicked.connect(self.clear_all_data)
         content_layout.addWidget(self.btn_clear_data)
 
+        self._stats_built = True
         self.update_statistics()
 
     def update_statistics(self):
         """Update statistics table and pie charts"""
+        if not self._stats_built or not self._stats_dirty:
+            return
+        self._stats_dirty = False
         total_reg_orders = len(self.registered_orders)
         total_unreg_orders = len(self.unregistered_orders)
-        total_amount = sum(sum(item[4] for item in order['items']) for order in self.registered_orders)
+        total_amount = self._total_amount
         avg_order = total_amount / total_reg_orders if total_reg_orders > 0 else 0
 
         # Update table
-        table_data = [
-            ((f"{total_reg_orders}"),("تعداد سفارشات ثبت شده")),
-            ((f"{total_unreg_orders}"),("تعداد سفارشات ثبت نشده")),
-            ((f"{total_amount:,.0f} تومان"),("جمع کل فروش (سفارشات ثبت شده)")),
-            ((f"{avg_order:,.0f} تومان"),("میانگین هر سفارش (ثبت شده)"))
+        values = [
+            f"{total_reg_orders}",
+            f"{total_unreg_orders}",
+            f"{total_amount:,.0f} تومان",
+            f"{avg_order:,.0f} تومان"
         ]
-        for row, (value, desc) in enumerate(table_data):
-            value_item = QTableWidgetItem(value)
-            desc_item = QTableWidgetItem(desc)
-            value_item.setTextAlignment(Qt.AlignCenter)
-            desc_item.setTextAlignment(Qt.AlignCenter)
-            value_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-            desc_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-            value_item.setFont(load_qt_font())
-            desc_item.setFont(load_qt_font())
-            self.stats_table.setItem(row, 0, value_item)
-            self.stats_table.setItem(row, 1, desc_item)
+        self.stats_table.setUpdatesEnabled(False)
+        for row, value in enumerate(values):
+            self.stats_table.item(row, 0).setText(value)
+        self.stats_table.setUpdatesEnabled(True)
 
         # Registered orders pie chart
-        self.figure_reg.clear()
-        ax_reg = self.figure_reg.add_subplot(111)
-        labels_reg = [reshape('سفارشات ثبت شده'), reshape('بدون سفارش')]
         sizes_reg = [total_reg_orders, 1 if total_reg_orders == 0 else 0]
         colors_reg = ['#1976D2', '#B0BEC5']
-        ax_reg.pie(sizes_reg, labels=labels_reg, colors=colors_reg, autopct='%1.1f%%', startangle=90, textprops={'fontfamily': FONT_NAME, 'fontsize': 10})
-        ax_reg.set_title(reshape("وضعیت سفارشات ثبت شده"), fontfamily=FONT_NAME, fontsize=12)
-        self.canvas_reg.draw()
+        self.draw_pie(self.ax_reg, self.canvas_reg, sizes_reg, _LBL_REG, colors_reg, _TITLE_REG)
 
         # Unregistered orders pie chart
-        self.figure_unreg.clear()
-        ax_unreg = self.figure_unreg.add_subplot(111)
-        labels_unreg = [reshape('سفارشات ثبت نشده'), reshape('بدون سفارش')]
         sizes_unreg = [total_unreg_orders, 1 if total_unreg_orders == 0 else 0]
         colors_unreg = ['#D32F2F', '#B0BEC5']
-        ax_unreg.pie(sizes_unreg, labels=labels_unreg, colors=colors_unreg, autopct='%1.1f%%', startangle=90, textprops={'fontfamily': FONT_NAME, 'fontsize': 10})
-        ax_unreg.set_title(reshape("وضعیت سفارشات ثبت نشده"), fontfamily=FONT_NAME, fontsize=12)
-        self.canvas_unreg.draw()
+        self.draw_pie(self.ax_unreg, self.canvas_unreg, sizes_unreg, _LBL_UNREG, colors_unreg, _TITLE_UNREG)
+
+    def draw_pie(self, ax, canvas, sizes, labels, colors, title):
+        """Redraw a pie chart on its cached axes, only when the data changed"""
+        if self._pie_sizes.get(canvas) == sizes:
+            return
+        self._pie_sizes[canvas] = sizes
+        ax.clear()
+        ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90, textprops={'fontfamily': FONT_NAME, 'fontsize': 10})
+        ax.set_title(title, fontfamily=FONT_NAME, fontsize=12)
+        canvas.draw_idle()
+
+    def fill_orders_list(self, list_widget, orders):
+        """Rebuild an orders list widget without intermediate repaints"""
+        list_widget.setUpdatesEnabled(False)
+        list_widget.blockSignals(True)
+        list_widget.clear()
+        list_widget.addItems([_format_order(order, i) for i, order in enumerate(orders)])
+        list_widget.blockSignals(False)
+        list_widget.setUpdatesEnabled(True)
 
     def update_registered_orders_list(self):
         """Update list of registered orders"""
-        self.orders_list.clear()
-        for i, order in enumerate(self.registered_orders):
-            total = sum(item[4] for item in order['items'])
-            self.orders_list.addItem(
-                (f"سفارش #{i+1} | مشتری: {order['buyer_name']} | تاریخ: {order['date']} | جمع: {total:,.0f} تومان")
-            )
+        self.fill_orders_list(self.orders_list, self.registered_orders)
 
     def update_unregistered_orders_list(self):
         """Update list of unregistered orders"""
-        self.unreg_orders_list.clear()
-        for i, order in enumerate(self.unregistered_orders):
-            total = sum(item[4] for item in order['items'])
-            self.unreg_orders_list.addItem(
-                (f"سفارش #{i+1} | مشتری: {order['buyer_name']} | تاریخ: {order['date']} | جمع: {total:,.0f} تومان")
-            )
+        self.fill_orders_list(self.unreg_orders_list, self.unregistered_orders)
 
     def edit_order(self, item, is_registered):
         """Edit selected order"""
@@ -596,15 +918,13 @@ class InvoiceApp(QWidget):
             if not updated_order['buyer_name'].strip():
                 QMessageBox.warning(self, "خطا", "نام مشتری نمی‌تواند خالی باشد.")
                 return
-            if updated_order['buyer_phone'] and not re.match(r'^09\d{9}$', updated_order['buyer_phone']):
+            if updated_order['buyer_phone'] and not _PHONE_RE.match(updated_order['buyer_phone']):
                 QMessageBox.warning(self, "خطا", "شماره تلفن مشتری باید معتبر باشد (مثال: 09123456789).")
                 return
             order_list[row] = updated_order
-            self.save_data()
-            if is_registered:
-                self.update_registered_orders_list()
-            else:
-                self.update_unregistered_orders_list()
+            self._schedule_save()
+            list_widget = self.orders_list if is_registered else self.unreg_orders_list
+            list_widget.item(row).setText(_format_order(updated_order, row))
             self.update_statistics()
             QMessageBox.information(self, "موفقیت", "سفارش با موفقیت ویرایش شد.")
 
@@ -614,324 +934,33 @@ class InvoiceApp(QWidget):
         if not selected_items:
             QMessageBox.warning(self, "خطا", "لطفاً یک سفارش ثبت نشده انتخاب کنید.")
             return
-        if QMessageBox.question(self, "تأیید", "آیا مطمئن هستید که می‌خواهید این سفارش را به ثبت شده منتقل کنید؟",
-                              QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
+        if self._confirm("آیا مطمئن هستید که می‌خواهید این سفارش را به ثبت شده منتقل کنید؟"):
             row = self.unreg_orders_list.row(selected_items[0])
             order = self.unregistered_orders.pop(row)
             self.registered_orders.append(order)
-            self.save_data()
-            self.update_registered_orders_list()
+            self._total_amount += order['total']
+            self._stats_dirty = True
+            self._schedule_save()
+            self.orders_list.addItem(_format_order(order, len(self.registered_orders) - 1))
             self.update_unregistered_orders_list()
             self.update_statistics()
             QMessageBox.information(self, "موفقیت", "سفارش با موفقیت به ثبت شده منتقل شد.")
 
     def apply_theme(self):
         """Apply dark or light theme"""
-        if self.is_dark_theme:
-            stylesheet = """
-                QWidget {
-                    background-color: #212121;
-                    color: #E0E0E0;
-                    font-family: """ + FONT_NAME + """;
-                    font-size: 11pt;
-                }
-                QTabWidget::pane {
-                    border: 1px solid #555555;
-                    background: #2D2D2D;
-                }
-                QTabBar::tab {
-                    background: #2D2D2D;
-                    color: #E0E0E0;
-                    padding: 8px 16px;
-                    margin: 4px;
-                    border-radius: 4px;
-                }
-                QTabBar::tab:selected {
-                    background: #1976D2;
-                    color: white;
-                }
-                QLabel {
-                    background: transparent;
-                    color: #E0E0E0;
-                    padding: 8px;
-                    margin: 2px;
-                }
-                QLineEdit, QComboBox, QTextEdit {
-                    background-color: #2D2D2D;
-                    border: 1px solid #555555;
-                    border-radius: 4px;
-                    padding: 8px;
-                    color: #E0E0E0;
-                    text-align: right;
-                    margin-bottom: 8px;
-                }
-                QComboBox {
-                    padding-right: 12px;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                    width: 16px;
-                }
-                QPushButton {
-                    background-color: #1976D2;
-                    color: white;
-                    border: 1px solid #1565C0;
-                    border-radius: 4px;
-                    padding: 8px;
-                    font-weight: bold;
-                    font-size: 11pt;
-                    margin-top: 8px;
-                }
-                QPushButton:hover {
-                    background-color: #1565C0;
-                }
-                QPushButton:pressed {
-                    background-color: #0D47A1;
-                }
-                QPushButton#minimizeBtn {
-                    background-color: #424242;
-                    border: 1px solid #616161;
-                    border-radius: 4px;
-                }
-                QPushButton#minimizeBtn:hover {
-                    background-color: #616161;
-                }
-                QPushButton#minimizeBtn:pressed {
-                    background-color: #212121;
-                }
-                QPushButton#closeBtn, QPushButton#deleteBtn {
-                    background-color: #D32F2F;
-                    border: 1px solid #B71C1C;
-                    border-radius: 4px;
-                }
-                QPushButton#closeBtn:hover, QPushButton#deleteBtn:hover {
-                    background-color: #B71C1C;
-                }
-                QPushButton#closeBtn:pressed, QPushButton#deleteBtn:pressed {
-                    background-color: #7F0000;
-                }
-                QPushButton#moveBtn {
-                    background-color: #388E3C;
-                    border: 1px solid #2E7D32;
-                    border-radius: 4px;
-                }
-                QPushButton#moveBtn:hover {
-                    background-color: #2E7D32;
-                }
-                QPushButton#moveBtn:pressed {
-                    background-color: #1B5E20;
-                }
-                QFrame#infoFrame {
-                    background-color: #2D2D2D;
-                    border: 1px solid #555555;
-                    border-radius: 6px;
-                    padding: 12px;
-                }
-                QListWidget#itemList {
-                    background-color: #2D2D2D;
-                    border: 1px solid #555555;
-                    border-radius: 4px;
-                    padding: 8px;
-                    color: #E0E0E0;
-                }
-                QTableWidget#statsTable {
-                    background-color: #2D2D2D;
-                    border: 1px solid #555555;
-                    border-radius: 4px;
-                    color: #E0E0E0;
-                    gridline-color: #555555;
-                    font-family: """ + FONT_NAME + """;
-                    font-size: 10pt;
-                }
-                QTableWidget#statsTable::item {
-                    padding: 10px;
-                    text-align: center;
-                }
-                QHeaderView::section {
-                    font-family: """ + FONT_NAME + """;
-                    font-size: 10pt;
-                    padding: 8px;
-                    background-color: #1976D2;
-                    color: white;
-                    border: none;
-                }
-                QCheckBox {
-                    color: #E0E0E0;
-                    padding: 8px;
-                    font-size: 10pt;
-                    font-weight: bold;
-                }
-                QLabel#headerLabel {
-                    background: transparent;
-                    color: #64B5F6;
-                    border-bottom: 2px solid #1976D2;
-                    padding: 8px;
-                    margin: 2px;
-                    font-size: 13pt;
-                }
-                QLabel#githubLabel {
-                    color: #64B5F6;
-                    padding: 8px;
-                    font-size: 10pt;
-                    font-weight: bold;
-                }
-                QLabel#githubLabel:hover {
-                    color: #BBDEFB;
-                }
-            """
-        else:
-            stylesheet = """
-                QWidget {
-                    background-color: #F5F6FA;
-                    color: #1A2526;
-                    font-family: """ + FONT_NAME + """;
-                    font-size: 11pt;
-                }
-                QTabWidget::pane {
-                    border: 1px solid #B0BEC5;
-                    background: #FFFFFF;
-                }
-                QTabBar::tab {
-                    background: #E0E0E0;
-                    color: #1A2526;
-                    padding: 8px 16px;
-                    margin: 4px;
-                    border-radius: 4px;
-                }
-                QTabBar::tab:selected {
-                    background: #1976D2;
-                    color: white;
-                }
-                QLabel {
-                    background: transparent;
-                    color: #1A2526;
-                    padding: 8px;
-                    margin: 2px;
-                }
-                QLineEdit, QComboBox, QTextEdit {
-                    background-color: #FFFFFF;
-                    border: 1px solid #B0BEC5;
-                    border-radius: 4px;
-                    padding: 8px;
-                    color: #1A2526;
-                    text-align: right;
-                    margin-bottom: 8px;
-                }
-                QComboBox {
-                    padding-right: 12px;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                    width: 16px;
-                }
-                QPushButton {
-                    background-color: #1976D2;
-                    color: white;
-                    border: 1px solid #1565C0;
-                    border-radius: 4px;
-                    padding: 8px;
-                    font-weight: bold;
-                    font-size: 11pt;
-                    margin-top: 8px;
-                }
-                QPushButton:hover {
-                    background-color: #1565C0;
-                }
-                QPushButton:pressed {
-                    background-color: #0D47A1;
-                }
-                QPushButton#minimizeBtn {
-                    background-color: #E0E0E0;
-                    border: 1px solid #B0BEC5;
-                    border-radius: 4px;
-                }
-                QPushButton#minimizeBtn:hover {
-                    background-color: #B0BEC5;
-                }
-                QPushButton#minimizeBtn:pressed {
-                    background-color: #90A4AE;
-                }
-                QPushButton#closeBtn, QPushButton#deleteBtn {
-                    background-color: #D32F2F;
-                    border: 1px solid #B71C1C;
-                    border-radius: 4px;
-                }
-                QPushButton#closeBtn:hover, QPushButton#deleteBtn:hover {
-                    background-color: #B71C1C;
-                }
-                QPushButton#closeBtn:pressed, QPushButton#deleteBtn:pressed {
-                    background-color: #7F0000;
-                }
-                QPushButton#moveBtn {
-                    background-color: #388E3C;
-                    border: 1px solid #2E7D32;
-                    border-radius: 4px;
-                }
-                QPushButton#moveBtn:hover {
-                    background-color: #2E7D32;
-                }
-                QPushButton#moveBtn:pressed {
-                    background-color: #1B5E20;
-                }
-                QFrame#infoFrame {
-                    background-color: #FFFFFF;
-                    border: 1px solid #B0BEC5;
-                    border-radius: 6px;
-                    padding: 12px;
-                }
-                QListWidget#itemList {
-                    background-color: #FFFFFF;
-                    border: 1px solid #B0BEC5;
-                    border-radius: 4px;
-                    padding: 8px;
-                    color: #1A2526;
-                }
-                QTableWidget#statsTable {
-                    background-color: #FFFFFF;
-                    border: 1px solid #B0BEC5;
-                    border-radius: 4px;
-                    color: #1A2526;
-                    gridline-color: #B0BEC5;
-                    font-family: """ + FONT_NAME + """;
-                    font-size: 10pt;
-                }
-                QTableWidget#statsTable::item {
-                    padding: 10px;
-                    text-align: center;
-                }
-                QHeaderView::section {
-                    font-family: """ + FONT_NAME + """;
-                    font-size: 10pt;
-                    padding: 8px;
-                    background-color: #1976D2;
-                    color: white;
-                    border: none;
-                }
-                QCheckBox {
-                    color: #1A2526;
-                    padding: 8px;
-                    font-size: 10pt;
-                    font-weight: bold;
-                }
-                QLabel#headerLabel {
-                    background: transparent;
-                    color: #1976D2;
-                    border-bottom: 2px solid #1976D2;
-                    padding: 8px;
-                    margin: 2px;
-                    font-size: 13pt;
-                }
-                QLabel#githubLabel {
-                    color: #1976D2;
-                    padding: 8px;
-                    font-size: 10pt;
-                    font-weight: bold;
-                }
-                QLabel#githubLabel:hover {
-                    color: #1565C0;
-                }
-            """
-        self.setStyleSheet(stylesheet)
+        self.setStyleSheet(_STYLESHEETS[self.is_dark_theme])
+
+    def _today(self):
+        """Return today's date as YYYY/MM/DD, formatting it once per day"""
+        today = datetime.date.today()
+        if today.toordinal() != self._today_ord:
+            self._today_str = today.strftime('%Y/%m/%d')
+            self._today_ord = today.toordinal()
+        return self._today_str
+
+    def _confirm(self, message):
+        """Ask a yes/no confirmation question"""
+        return QMessageBox.question(self, "تأیید", message, self._YES_NO) == QMessageBox.Yes
 
     def toggle_theme(self):
         """Toggle between dark and light theme"""
@@ -944,11 +973,11 @@ class InvoiceApp(QWidget):
             return False, "نام فروشنده نمی‌تواند خالی باشد."
         if not self.buyer_name.text().strip():
             return False, "نام مشتری نمی‌تواند خالی باشد."
-        if self.seller_phone.text() and not re.match(r'^09\d{9}$', self.seller_phone.text()):
+        if self.seller_phone.text() and not _PHONE_RE.match(self.seller_phone.text()):
             return False, "شماره تلفن فروشنده باید معتبر باشد (مثال: 09123456789)."
-        if self.buyer_phone.text() and not re.match(r'^09\d{9}$', self.buyer_phone.text()):
+        if self.buyer_phone.text() and not _PHONE_RE.match(self.buyer_phone.text()):
             return False, "شماره تلفن مشتری باید معتبر باشد (مثال: 09123456789)."
-        if self.seller_email.text() and not re.match(r'^[\w\.-]+@[\w\.-]+\.\w+$', self.seller_email.text()):
+        if self.seller_email.text() and not _EMAIL_RE.match(self.seller_email.text()):
             return False, "ایمیل فروشنده باید معتبر باشد."
         return True, ""
 
@@ -960,7 +989,7 @@ class InvoiceApp(QWidget):
             return
         
         try:
-            price = float(self.item_price.text().replace(",", "").strip())
+            price = float(self.item_price.text().translate(_DROP_CHARS))
             quantity = float(self.item_quantity.text().strip())
             if price <= 0 or quantity <= 0:
                 raise ValueError
@@ -970,8 +999,10 @@ class InvoiceApp(QWidget):
 
         unit = self.item_unit.currentText()
         total = price * quantity
-        self.items.append((name, price, quantity, unit, total))
-        self.list_widget.addItem((f"{name} | {price:,.0f} × {quantity} {unit} = {total:,.0f} تومان"))
+        item = (name, price, quantity, unit, total)
+        self.items.append(item)
+        self._running_total += total
+        self.list_widget.addItem(_fmt_item_row(item))
         self.update_total()
 
         self.item_name.clear()
@@ -984,12 +1015,31 @@ class InvoiceApp(QWidget):
         if not selected_items:
             QMessageBox.warning(self, "خطا", "لطفاً یک کالا از لیست انتخاب کنید.")
             return
-        if QMessageBox.question(self, "تأیید", "آیا مطمئن هستید که می‌خواهید این کالا را حذف کنید؟",
-                              QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
-            row = self.list_widget.row(selected_items[0])
-            self.list_widget.takeItem(row)
-            self.items.pop(row)
-            self.update_total()
+        row = self.list_widget.row(selected_items[0])
+        self.list_widget.takeItem(row)
+        item = self.items.pop(row)
+        # Re-sum rather than subtract, so float error cannot drift into order totals
+        self._running_total = sum(entry[4] for entry in self.items)
+        self._last_deleted_item = (row, item)
+        self.update_total()
+
+    def undo_delete_item(self):
+        """Restore the item removed by the last delete_item"""
+        if self._last_deleted_item is None:
+            return
+        row, item = self._last_deleted_item
+        self._last_deleted_item = None
+        self.items.insert(row, item)
+        self.list_widget.insertItem(row, _fmt_item_row(item))
+        self._running_total = sum(entry[4] for entry in self.items)
+        self.update_total()
+
+    def remove_order(self, orders, list_widget, row):
+        """Remove an order and renumber the list entries after it"""
+        list_widget.takeItem(row)
+        orders.pop(row)
+        for i in range(row, len(orders)):
+            list_widget.item(i).setText(_format_order(orders[i], i))
 
     def delete_registered_order(self):
         """Delete selected registered order"""
@@ -997,12 +1047,13 @@ class InvoiceApp(QWidget):
         if not selected_items:
             QMessageBox.warning(self, "خطا", "لطفاً یک سفارش انتخاب کنید.")
             return
-        if QMessageBox.question(self, "تأیید", "آیا مطمئن هستید که می‌خواهید این سفارش را حذف کنید؟",
-                              QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
+        if self._confirm("آیا مطمئن هستید که می‌خواهید این سفارش را حذف کنید؟"):
             row = self.orders_list.row(selected_items[0])
-            self.orders_list.takeItem(row)
-            self.registered_orders.pop(row)
-            self.save_data()
+            self.remove_order(self.registered_orders, self.orders_list, row)
+            # Re-sum rather than subtract, so float error cannot leave "-0" behind
+            self._total_amount = sum(order['total'] for order in self.registered_orders)
+            self._stats_dirty = True
+            self._schedule_save()
             self.update_statistics()
 
     def delete_unregistered_order(self):
@@ -1011,12 +1062,11 @@ class InvoiceApp(QWidget):
         if not selected_items:
             QMessageBox.warning(self, "خطا", "لطفاً یک سفارش انتخاب کنید.")
             return
-        if QMessageBox.question(self, "تأیید", "آیا مطمئن هستید که می‌خواهید این سفارش را حذف کنید؟",
-                              QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
+        if self._confirm("آیا مطمئن هستید که می‌خواهید این سفارش را حذف کنید؟"):
             row = self.unreg_orders_list.row(selected_items[0])
-            self.unreg_orders_list.takeItem(row)
-            self.unregistered_orders.pop(row)
-            self.save_data()
+            self.remove_order(self.unregistered_orders, self.unreg_orders_list, row)
+            self._stats_dirty = True
+            self._schedule_save()
             self.update_statistics()
 
     def add_to_registered_orders(self):
@@ -1030,9 +1080,9 @@ class InvoiceApp(QWidget):
             QMessageBox.warning(self, "توجه", "هیچ کالایی ثبت نشده است.")
             return
 
-        total_all = sum(item[4] for item in self.items)
+        total_all = self._running_total
         order = {
-            'date': datetime.datetime.now().strftime('%Y/%m/%d'),
+            'date': self._today(),
             'seller_name': self.seller_name.text(),
             'seller_phone': self.seller_phone.text(),
             'seller_email': self.seller_email.text(),
@@ -1042,12 +1092,14 @@ class InvoiceApp(QWidget):
             'buyer_address': self.buyer_address.text(),
             'buyer_postal': self.buyer_postal.text(),
             'buyer_country': self.buyer_country.text(),
-            'items': self.items.copy(),
+            'items': self.items,
             'total': total_all
         }
         self.registered_orders.append(order)
-        self.save_data()
-        self.update_registered_orders_list()
+        self._total_amount += total_all
+        self._stats_dirty = True
+        self._schedule_save()
+        self.orders_list.addItem(_format_order(order, len(self.registered_orders) - 1))
         self.update_statistics()
         self.clear_form()
         self.tabs.setCurrentIndex(1)
@@ -1064,9 +1116,9 @@ class InvoiceApp(QWidget):
             QMessageBox.warning(self, "توجه", "هیچ کالایی ثبت نشده است.")
             return
 
-        total_all = sum(item[4] for item in self.items)
+        total_all = self._running_total
         order = {
-            'date': datetime.datetime.now().strftime('%Y/%m/%d'),
+            'date': self._today(),
             'seller_name': self.seller_name.text(),
             'seller_phone': self.seller_phone.text(),
             'seller_email': self.seller_email.text(),
@@ -1076,12 +1128,13 @@ class InvoiceApp(QWidget):
             'buyer_address': self.buyer_address.text(),
             'buyer_postal': self.buyer_postal.text(),
             'buyer_country': self.buyer_country.text(),
-            'items': self.items.copy(),
+            'items': self.items,
             'total': total_all
         }
         self.unregistered_orders.append(order)
-        self.save_data()
-        self.update_unregistered_orders_list()
+        self._stats_dirty = True
+        self._schedule_save()
+        self.unreg_orders_list.addItem(_format_order(order, len(self.unregistered_orders) - 1))
         self.update_statistics()
         self.clear_form()
         self.tabs.setCurrentIndex(1)
@@ -1089,7 +1142,10 @@ class InvoiceApp(QWidget):
 
     def clear_form(self):
         """Clear all input fields and item list"""
-        self.items.clear()
+        # Rebind rather than clear: a just-saved order owns the old list
+        self.items = []
+        self._running_total = 0
+        self._last_deleted_item = None
         self.list_widget.clear()
         self.seller_name.clear()
         self.seller_phone.clear()
@@ -1107,30 +1163,34 @@ class InvoiceApp(QWidget):
 
     def update_total(self):
         """Update total display"""
-        total_all = sum(item[4] for item in self.items)
+        total_all = self._running_total
         self.total_label.setText((f"جمع کل: {total_all:,.0f} تومان"))
 
     def clear_items(self):
         """Clear item list"""
-        if QMessageBox.question(self, "تأیید", "آیا مطمئن هستید که می‌خواهید لیست کالاها را پاک کنید؟",
-                              QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
+        if self._confirm("آیا مطمئن هستید که می‌خواهید لیست کالاها را پاک کنید؟"):
             self.items.clear()
+            self._running_total = 0
+            self._last_deleted_item = None
             self.list_widget.clear()
             self.update_total()
 
     def clear_all_data(self):
         """Clear all orders and update UI"""
-        if QMessageBox.question(self, "تأیید", "آیا مطمئن هستید که می‌خواهید تمام داده‌ها را حذف کنید؟",
-                              QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
+        if self._confirm("آیا مطمئن هستید که می‌خواهید تمام داده‌ها را حذف کنید؟"):
             self.registered_orders.clear()
             self.unregistered_orders.clear()
+            self._total_amount = 0
+            self._stats_dirty = True
             self.orders_list.clear()
             self.unreg_orders_list.clear()
             self.items.clear()
+            self._running_total = 0
+            self._last_deleted_item = None
             self.list_widget.clear()
             self.update_total()
             self.update_statistics()
-            self.save_data()
+            self._schedule_save()
             QMessageBox.information(self, "موفقیت", "تمامی داده‌ها با موفقیت حذف شدند.")
 
     def export_pdf(self):
@@ -1149,28 +1209,34 @@ class InvoiceApp(QWidget):
             return
 
         try:
+            # ReportLab is only needed here, so it is imported on first export
+            from reportlab.pdfgen import canvas
+            from reportlab.lib.pagesizes import A4
+            from reportlab.lib.colors import HexColor
+            pdf_font = register_pdf_font()
+
             c = canvas.Canvas(path, pagesize=A4)
             width, height = A4
-            c.setFont(FONT_NAME, 12)
+            c.setFont(pdf_font, 12)
 
             # Header
             c.setFillColor(HexColor("#1976D2"))
             c.rect(0, height - 40, width, 40, fill=1)
             c.setFillColor(HexColor("#FFFFFF"))
-            c.setFont(FONT_NAME, 16)
-            c.drawCentredString(width/2, height - 28, reshape("پیش‌فاکتور حرفه‌ای"))
+            c.setFont(pdf_font, 16)
+            c.drawCentredString(width/2, height - 28, _PDF_TITLE)
             c.setFillColor(HexColor("#000000"))
 
             y = height - 80
 
             # Seller and Buyer info
-            c.setFont(FONT_NAME, 11)
+            c.setFont(pdf_font, 11)
             c.setFillColor(HexColor("#1A2526"))
-            c.drawString(40, y, reshape("اطلاعات فروشنده"))
-            c.drawRightString(width - 40, y, reshape("اطلاعات خریدار"))
+            c.drawString(40, y, _PDF_SELLER_INFO)
+            c.drawRightString(width - 40, y, _PDF_BUYER_INFO)
             y -= 25
             
-            c.setFont(FONT_NAME, 10)
+            c.setFont(pdf_font, 10)
             c.drawString(40, y, reshape(f"نام: {self.seller_name.text()}"))
             c.drawRightString(width - 40, y, reshape(f"نام: {self.buyer_name.text()}"))
             y -= 20
@@ -1194,46 +1260,53 @@ class InvoiceApp(QWidget):
             y -= 30
 
             # Items table
-            headers = ["ردیف", "نام کالا", "قیمت واحد", "تعداد", "واحد", "قیمت کل"]
             col_widths = [30, 200, 80, 50, 50, 100]
+            # offsets[i] is the width of all columns right of column i
+            offsets = []
+            table_width = 0
+            for col_width in col_widths:
+                offsets.append(table_width)
+                table_width += col_width
+            x = width - 30
+            table_left = x - table_width
+            # Horizontal center of each column
+            cell_centers = [x - offset - col_width * 0.5 for offset, col_width in zip(offsets, col_widths)]
             table_top = y
             row_height = 25
 
             # Table header
             c.setFillColor(HexColor("#1976D2"))
-            c.rect(width - sum(col_widths) - 30, table_top - row_height, sum(col_widths), row_height, fill=1)
+            c.rect(table_left, table_top - row_height, table_width, row_height, fill=1)
             c.setFillColor(HexColor("#FFFFFF"))
-            c.setFont(FONT_NAME, 11)
-            x = width - 30
-            for i, header in enumerate(headers):
-                c.drawCentredString(x - sum(col_widths[:i]) - col_widths[i]/2, table_top - row_height + 6, reshape(header))
+            c.setFont(pdf_font, 11)
+            for center, header in zip(cell_centers, _PDF_HEADERS):
+                c.drawCentredString(center, table_top - row_height + 6, header)
+
+            # Table data: row backgrounds grouped by fill color, then all cell text
+            row_bottoms = [table_top - row_height * (idx + 1) for idx in range(1, len(self.items) + 1)]
+            for fill_color, first_row in ((HexColor("#F5F7FA"), 0), (HexColor("#FFFFFF"), 1)):
+                c.setFillColor(fill_color)
+                for bottom in row_bottoms[first_row::2]:
+                    c.rect(table_left, bottom, table_width, row_height, fill=1)
             c.setFillColor(HexColor("#000000"))
-
-            # Table data
-            total_all = 0
-            y = table_top - row_height
-            for idx, (name, price, qty, unit, total) in enumerate(self.items, 1):
+            for bottom, (idx, (name, price, qty, unit, total)) in zip(row_bottoms, enumerate(self.items, 1)):
                 row = [str(idx), name, f"{price:,.0f}", str(qty), unit, f"{total:,.0f}"]
-                c.setFillColor(HexColor("#F5F7FA") if idx % 2 else HexColor("#FFFFFF"))
-                c.rect(width - sum(col_widths) - 30, y - row_height, sum(col_widths), row_height, fill=1)
-                c.setFillColor(HexColor("#000000"))
-                for i, cell in enumerate(row):
-                    c.drawCentredString(x - sum(col_widths[:i]) - col_widths[i]/2, y - row_height + 6, reshape(cell))
-                y -= row_height
-                total_all += total
+                for center, cell in zip(cell_centers, row):
+                    c.drawCentredString(center, bottom + 6, reshape(cell))
+            y = row_bottoms[-1]
 
             # Total
             y -= 20
-            c.setFont(FONT_NAME, 12)
+            c.setFont(pdf_font, 12)
             c.setFillColor(HexColor("#1976D2"))
-            c.drawRightString(width - 30, y, reshape(f"جمع کل: {total_all:,.0f} تومان"))
+            c.drawRightString(width - 30, y, reshape(f"جمع کل: {self._running_total:,.0f} تومان"))
             c.setFillColor(HexColor("#000000"))
 
             # Footer
-            c.setFont(FONT_NAME, 9)
+            c.setFont(pdf_font, 9)
             c.setFillColor(HexColor("#666666"))
-            c.drawCentredString(width/2, 40, reshape(f"ایجاد شده در: {datetime.datetime.now().strftime('%Y/%m/%d')}"))
-            c.drawCentredString(width/2, 25, reshape("نرم‌افزارهای کاربردی ویندوز | توسعه توسط Amir-Mahdi-Barati"))
+            c.drawCentredString(width/2, 40, reshape(f"ایجاد شده در: {self._today()}"))
+            c.drawCentredString(width/2, 25, _PDF_FOOTER)
 
             c.save()
             QMessageBox.information(self, "موفقیت", "فایل PDF با موفقیت ذخیره شد.")
@@ -1243,12 +1316,14 @@ class InvoiceApp(QWidget):
     def wrap_text(self, text, max_chars):
         """Wrap text for PDF display"""
         lines = []
+        # Strip once up front; each split then only trims the cut edges
+        text = text.strip()
         while len(text) > max_chars:
             idx = text.rfind(" ", 0, max_chars)
             if idx == -1:
                 idx = max_chars
-            lines.append(text[:idx].strip())
-            text = text[idx:].strip()
+            lines.append(text[:idx].rstrip())
+            text = text[idx:].lstrip()
         if text:
             lines.append(text)
         return lines or [""]